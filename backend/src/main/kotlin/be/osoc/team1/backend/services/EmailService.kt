@@ -94,13 +94,20 @@ class EmailService(environment: Environment, private val mailSender: JavaMailSen
     private var passwordSender: String? = environment["OSOC_GMAIL_APP_PASSWORD"]
     private val baseUrl = environment["OSOC_FRONTEND_URL"] ?: "http://localhost:3000"
 
+    /**
+     * SMTP server to send emails through. This is gmail, unless it is overridden to point to another server, like a
+     * local SMTP server while benchmarking.
+     */
+    private val smtpHost = environment["OSOC_SMTP_HOST"] ?: "smtp.gmail.com"
+    private val smtpPort = environment["OSOC_SMTP_PORT"]?.toInt() ?: 587
+
     /**
      * Initialise the [mailSender].
      */
     init {
         mailSender.apply {
-            host = "smtp.gmail.com"
-            port = 587
+            host = smtpHost
+            port = smtpPort
             username = emailAddressSender
             password = passwordSender
         }
@@ -23,18 +23,28 @@ class EmailServiceTests {
     private val testEmail = "test@email.com"
     private val captureSimpleMailMessage = slot<SimpleMailMessage>()
 
-    private fun getEnvironment(emailSet: Boolean = true, passwordSet: Boolean = true): Environment {
+    private val captureHost = slot<String>()
+    private val capturePort = slot<Int>()
+
+    private fun getEnvironment(
+        emailSet: Boolean = true,
+        passwordSet: Boolean = true,
+        smtpHost: String? = null,
+        smtpPort: String? = null
+    ): Environment {
         val environment: Environment = mockk()
         every { environment.getProperty("OSOC_GMAIL_ADDRESS") } returns if (emailSet) "email@gmail.com" else null
         every { environment.getProperty("OSOC_GMAIL_APP_PASSWORD") } returns if (passwordSet) "app_password" else null
         every { environment.getProperty("OSOC_FRONTEND_URL") } returns "https://sel2-1.ugent.be"
+        every { environment.getProperty("OSOC_SMTP_HOST") } returns smtpHost
+        every { environment.getProperty("OSOC_SMTP_PORT") } returns smtpPort
         return environment
     }
 
     private fun getMailSender(): JavaMailSenderImpl {
         val mailSender: JavaMailSenderImpl = mockk()
-        every { mailSender.host = any() } just Runs
-        every { mailSender.port = any() } just Runs
+        every { mailSender.host = capture(captureHost) } just Runs
+        every { mailSender.port = capture(capturePort) } just Runs
         every { mailSender.username = any() } just Runs
         every { mailSender.password = any() } just Runs
         every { mailSender.javaMailProperties } returns Properties()
@@ -66,6 +76,20 @@ class EmailServiceTests {
         )
     }
 
+    @Test
+    fun `mail sender uses gmail by default`() {
+        EmailService(getEnvironment(), getMailSender())
+        assertEquals("smtp.gmail.com", captureHost.captured)
+        assertEquals(587, capturePort.captured)
+    }
+
+    @Test
+    fun `mail sender uses the smtp server from the environment variables`() {
+        EmailService(getEnvironment(smtpHost = "localhost", smtpPort = "2525"), getMailSender())
+        assertEquals("localhost", captureHost.captured)
+        assertEquals(2525, capturePort.captured)
+    }
+
     @Test
     fun `sendEmail fails when email environment variable isn't set`() {
         val emailService = EmailService(getEnvironment(emailSet = false), JavaMailSenderImpl())
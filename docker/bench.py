@@ -0,0 +1,26 @@
+#!/bin/python3
+"""
+Load and benchmark tooling that runs against a local backend, see README.md for the available modes.
+
+    python3 bench.py <mode> [options]
+"""
+import importlib
+import sys
+
+modes = {
+    "teardown": "teardown",
+    "churn": "churn",
+    "search": "search",
+    "soak": "soak",
+    "mail": "mail",
+    "payload": "payload",
+    "polling": "polling",
+    "export": "export",
+}
+
+if len(sys.argv) < 2 or sys.argv[1] not in modes:
+    print("Usage: python3 bench.py <mode> [options]")
+    print("Possible modes are: " + ", ".join(modes))
+    sys.exit(1)
+
+importlib.import_module(modes[sys.argv[1]]).main()
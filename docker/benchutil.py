@@ -0,0 +1,199 @@
+import math
+import statistics
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+baseurl = 'http://localhost:8080/api'
+adminemail = 'tester@mail.com'
+adminpassword = 'tester'
+# password subpopulate.py gives to every coach it creates
+coachpassword = 'suuuuuperseeeeecret'
+
+
+def flag(name, short=None):
+    return name in sys.argv or (short is not None and short in sys.argv)
+
+
+def option(name, short=None, default=None, cast=str):
+    for i, arg in enumerate(sys.argv[:-1]):
+        if arg == name or (short is not None and arg == short):
+            return cast(sys.argv[i + 1])
+    return default
+
+
+def int_list(value):
+    return [int(part) for part in value.split(',') if part]
+
+
+def make_session(workers=10):
+    # one pooled session per run, so concurrent workers reuse connections instead of opening a socket per request
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class Auth:
+    """
+    Keeps a valid access token for one account. Access tokens only live for 5 minutes (see TokenUtil.kt),
+    so the account logs in again once the token gets close to expiring.
+    """
+
+    def __init__(self, session, email=adminemail, password=adminpassword, ttl=240):
+        self.session = session
+        self.email = email
+        self.password = password
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.token = None
+        self.refreshtoken = None
+        self.user = None
+        self.loggedin = 0
+
+    def login(self):
+        response = self.session.post(f'{baseurl}/login', data={"email": self.email, "password": self.password})
+        response.raise_for_status()
+        body = response.json()
+        self.token = body["accessToken"]
+        self.refreshtoken = body["refreshToken"]
+        self.user = body["user"]
+        self.loggedin = time.monotonic()
+        return body
+
+    def headers(self):
+        with self.lock:
+            if self.token is None or time.monotonic() - self.loggedin > self.ttl:
+                self.login()
+            return authheaders(self.token)
+
+
+def authheaders(token):
+    return {'Authorization': f'Basic {token}',
+            'Content-Type': 'application/json'}
+
+
+def id_from_url(url):
+    return url[url.rindex('/') + 1:]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def run_concurrently(func, items, workers):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples):
+    # samples are latencies in seconds, the summary is in milliseconds
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(samples),
+        "mean": statistics.fmean(samples) * 1000,
+        "p50": percentile(samples, 0.50) * 1000,
+        "p95": percentile(samples, 0.95) * 1000,
+        "p99": percentile(samples, 0.99) * 1000,
+        "max": max(samples) * 1000,
+    }
+
+
+def latency_row(name, samples):
+    summary = summarize(samples)
+    return [name, summary["count"]] + [f'{summary[key]:.1f}' for key in ("mean", "p50", "p95", "p99", "max")]
+
+
+latency_header = ["", "count", "mean ms", "p50 ms", "p95 ms", "p99 ms", "max ms"]
+
+
+def print_table(header, rows):
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows)]
+    print("  ".join(str(cell).ljust(width) for cell, width in zip(header, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)))
+    print()
+
+
+def active_edition(session, auth):
+    # the active edition as a dict, or None when there is none (the backend then answers with an empty body)
+    response = session.get(f'{baseurl}/editions/active', headers=auth.headers())
+    response.raise_for_status()
+    return response.json() if response.content else None
+
+
+def edition_name(session, auth, default=None):
+    # --edition when given, otherwise the default, otherwise the active edition
+    name = option("--edition", "-e") or default
+    if name is None:
+        active = active_edition(session, auth)
+        if active is None:
+            print("No edition is active, use --edition to choose one")
+            sys.exit(1)
+        name = active["name"]
+    return name
+
+
+def fetch_all(session, auth, url, params=None, pagesize=100):
+    # walks a paged endpoint (PagedCollection) one page at a time
+    params = dict(params or {})
+    page = 0
+    while True:
+        params.update({"pageNumber": page, "pageSize": pagesize})
+        response = session.get(url, headers=auth.headers(), params=params)
+        response.raise_for_status()
+        collection = response.json()["collection"]
+        yield from collection
+        if len(collection) < pagesize:
+            return
+        page += 1
+
+
+def stream(session, auth, url, params=None, pagesize=100, prefetch=4, stats=None):
+    """
+    Yields the items of a paged endpoint (PagedCollection) in order, while up to prefetch following pages are
+    already being fetched in parallel, so at most prefetch + 1 pages are held in memory. When a stats dict is given,
+    the number of pages and bytes received are added to it.
+    """
+    params = dict(params or {})
+
+    def page(number):
+        response = session.get(url, headers=auth.headers(), params=dict(params, pageNumber=number, pageSize=pagesize))
+        response.raise_for_status()
+        return len(response.content), response.json()
+
+    def consume(result):
+        size, body = result
+        if stats is not None:
+            stats["pages"] = stats.get("pages", 0) + 1
+            stats["bytes"] = stats.get("bytes", 0) + size
+        return body["collection"]
+
+    first = page(0)
+    pages = math.ceil(first[1]["totalLength"] / pagesize)
+    yield from consume(first)
+    with ThreadPoolExecutor(max_workers=max(1, prefetch)) as pool:
+        pending = deque()
+        following = 1
+        while following < pages or pending:
+            while following < pages and len(pending) < max(1, prefetch):
+                pending.append(pool.submit(page, following))
+                following += 1
+            yield from consume(pending.popleft().result())
@@ -0,0 +1,153 @@
+"""
+Churn mode: simulates coaches planning projects by drag and drop. Every planner keeps assigning students to
+positions, removing assignments and reading the students and conflicts of projects, all at the same time.
+
+    python3 bench.py churn [--edition osoc2022] [--planners 8] [--duration 60] [--students 200]
+
+ProjectService.postAssignment and deleteAssignment load and save the whole project, so concurrent planners on the
+same project can overwrite each other. Besides throughput and latency this reports such anomalies: the same student
+assigned to the same position twice, and assignment counts that don't add up to what the planners did.
+"""
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+
+from benchutil import (Auth, baseurl, edition_name, fetch_all, flag, id_from_url, latency_header, latency_row,
+                       make_session, option, print_table, run_concurrently)
+
+# relative weight of every planner operation
+mix = {"assign": 4, "unassign": 3, "students": 2, "conflicts": 1}
+
+
+class Tally:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.outcomes = defaultdict(Counter)
+
+    def record(self, operation, latency, outcome):
+        with self.lock:
+            self.latencies[operation].append(latency)
+            self.outcomes[operation][outcome] += 1
+
+
+def assignment_count(session, auth, edition, projects):
+    return sum(len(session.get(f'{baseurl}/{edition}/projects/{project["id"]}', headers=auth.headers())
+                   .json()["assignments"]) for project in projects)
+
+
+def operate(session, auth, edition, project, students, adminid, operation):
+    # returns the status code and when the timed request started, or None when there was nothing to do
+    start = time.perf_counter()
+    if operation == "assign":
+        response = session.post(f'{baseurl}/{edition}/projects/{project["id"]}/assignments', json={
+            "student": random.choice(students), "position": id_from_url(random.choice(project["positions"])),
+            "suggester": adminid, "reason": "churn"}, headers=auth.headers())
+    elif operation == "unassign":
+        # a planner drags a student off the board they are looking at, which may already be out of date
+        board = session.get(f'{baseurl}/{edition}/projects/{project["id"]}', headers=auth.headers())
+        board.raise_for_status()
+        assignments = board.json()["assignments"]
+        if not assignments:
+            return None
+        start = time.perf_counter()
+        response = session.delete(
+            f'{baseurl}/{edition}/projects/{project["id"]}/assignments/{id_from_url(random.choice(assignments))}',
+            headers=auth.headers())
+    elif operation == "students":
+        response = session.get(f'{baseurl}/{edition}/projects/{project["id"]}/students', headers=auth.headers())
+    else:
+        response = session.get(f'{baseurl}/{edition}/projects/conflicts', headers=auth.headers())
+    return start, response.status_code
+
+
+def planner(session, auth, edition, projects, students, adminid, deadline, tally):
+    operations = list(mix)
+    weights = list(mix.values())
+    while time.monotonic() < deadline:
+        operation = random.choices(operations, weights)[0]
+        start = time.perf_counter()
+        try:
+            result = operate(session, auth, edition, random.choice(projects), students, adminid, operation)
+        except Exception:
+            # a failed request is an outcome like any other, the planner keeps going
+            tally.record(operation, time.perf_counter() - start, "error")
+            continue
+        if result is not None:
+            start, status = result
+            tally.record(operation, time.perf_counter() - start, status)
+
+
+def check_invariants(session, auth, edition, projects, workers):
+    violations = Counter()
+    placements = defaultdict(set)
+
+    def check(project):
+        found = Counter()
+        body = session.get(f'{baseurl}/{edition}/projects/{project["id"]}', headers=auth.headers()).json()
+        assignments = run_concurrently(
+            lambda url: session.get(f'{baseurl}/assignments/{id_from_url(url)}', headers=auth.headers()).json(),
+            body["assignments"], workers)
+        pairs = Counter((assignment["student"], assignment["position"]) for assignment in assignments)
+        found["duplicate position assignments"] = sum(count - 1 for count in pairs.values())
+        assigned = {id_from_url(assignment["student"]) for assignment in assignments}
+        listed = {student["id"] for student in session.get(f'{baseurl}/{edition}/projects/{project["id"]}/students',
+                                                           headers=auth.headers()).json()}
+        found["project students not matching assignments"] = len(assigned ^ listed)
+        return project["id"], assigned, found
+
+    for projectid, assigned, found in run_concurrently(check, projects, workers):
+        violations.update(found)
+        for studentid in assigned:
+            placements[studentid].add(projectid)
+
+    conflicts = session.get(f'{baseurl}/{edition}/projects/conflicts', headers=auth.headers()).json()
+    expected = {studentid for studentid, projectids in placements.items() if len(projectids) > 1}
+    reported = {id_from_url(conflict["student"]) for conflict in conflicts}
+    violations["conflicts not matching assignments"] = len(expected ^ reported)
+    return violations
+
+
+def main():
+    planners = option("--planners", "-p", 8, int)
+    duration = option("--duration", "-t", 60, int)
+    workers = option("--workers", "-c", 8, int)
+    if flag("--seed", "-s"):
+        random.seed(1)
+    session = make_session(max(planners, workers))
+    auth = Auth(session)
+    auth.login()
+    edition = edition_name(session, auth)
+
+    projects = list(fetch_all(session, auth, f'{baseurl}/{edition}/projects'))
+    students = [student["id"] for student in fetch_all(session, auth, f'{baseurl}/{edition}/students',
+                                                       {"view": "Basic"})]
+    students = random.sample(students, min(len(students), option("--students", None, 200, int)))
+    before = assignment_count(session, auth, edition, projects)
+
+    tally = Tally()
+    deadline = time.monotonic() + duration
+    threads = [threading.Thread(target=planner, args=(session, auth, edition, projects, students, auth.user["id"],
+                                                      deadline, tally)) for _ in range(planners)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    operations = sum(len(latencies) for latencies in tally.latencies.values())
+    print(f'{planners} planners, {operations} operations in {elapsed:.1f}s: {operations / elapsed:.1f} ops/s\n')
+    print_table(latency_header, [latency_row(operation, tally.latencies[operation]) for operation in mix])
+    print_table(["", "status codes and errors"], [[operation, dict(tally.outcomes[operation])] for operation in mix])
+
+    # every accepted post adds exactly one assignment and every accepted delete removes one,
+    # any other difference is a write that got lost or duplicated while saving the project
+    assigned = sum(count for status, count in tally.outcomes["assign"].items() if status != "error" and status < 400)
+    unassigned = sum(count for status, count in tally.outcomes["unassign"].items()
+                     if status != "error" and status < 400)
+    violations = check_invariants(session, auth, edition, projects, workers)
+    violations["lost or phantom assignment writes"] = abs(
+        assignment_count(session, auth, edition, projects) - (before + assigned - unassigned))
+    print_table(["invariant", "violations"], [[name, count] for name, count in violations.items()])
@@ -0,0 +1,129 @@
+"""
+Export mode: streams every page of students and projects, plus the conflicts and users, and verifies them against
+what subpopulate.py seeded. It also measures how fast a whole edition can be exported.
+
+    python3 bench.py export [--manifest seed_manifest.json] [--page-size 100] [--prefetch 4] [--compare]
+
+subpopulate.py writes seed_manifest.json next to itself. Without a manifest only the relationships between the
+streamed entities are checked. Pages are streamed in order with up to --prefetch pages requested ahead. The student
+list only links to status suggestions, so the suggester of every suggestion is looked up while the students stream
+by, with at most --prefetch pages worth of lookups in flight. Students, suggestions and communications are only
+counted, so memory doesn't grow with them: only the assigned students, the conflicts and the users are kept.
+--compare also exports the students one page and one suggestion at a time, without prefetching, to compare the
+throughput.
+"""
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchutil import Auth, baseurl, edition_name, flag, id_from_url, make_session, option, print_table, stream
+
+
+def export_students(session, auth, edition, pagesize, prefetch):
+    stats = {}
+    totals = Counter()
+    suggesters = Counter()
+    lookups = deque()
+
+    def suggester(url):
+        response = session.get(f'{baseurl}/statusSuggestions/{id_from_url(url)}', headers=auth.headers())
+        response.raise_for_status()
+        return id_from_url(response.json()["suggester"])
+
+    def collect(lookup):
+        try:
+            suggesters[lookup.result()] += 1
+        except (requests.RequestException, KeyError, ValueError):
+            totals["failed suggestion lookups"] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, prefetch)) as pool:
+        for student in stream(session, auth, f'{baseurl}/{edition}/students', {"view": "Full"}, pagesize, prefetch,
+                              stats):
+            totals["students"] += 1
+            totals[student["status"]] += 1
+            totals["communications"] += len(student["communications"])
+            totals["suggestions"] += len(student["statusSuggestions"])
+            lookups.extend(pool.submit(suggester, url) for url in student["statusSuggestions"])
+            while len(lookups) > prefetch * pagesize:
+                collect(lookups.popleft())
+        while lookups:
+            collect(lookups.popleft())
+    return totals, suggesters, stats, time.perf_counter() - start
+
+
+def main():
+    pagesize = option("--page-size", None, 100, int)
+    prefetch = option("--prefetch", "-p", 4, int)
+    path = option("--manifest", "-m", os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_manifest.json'))
+    manifest = None
+    if os.path.exists(path):
+        with open(path) as file:
+            manifest = json.load(file)
+    else:
+        print(f'No manifest at {path}, only checking relationships')
+    # pages and suggestion lookups are both fetched with up to prefetch workers
+    session = make_session(2 * prefetch + 1)
+    auth = Auth(session)
+    auth.login()
+    edition = edition_name(session, auth, (manifest or {}).get("edition"))
+
+    checks = []
+
+    def check(name, expected, actual):
+        checks.append([name, expected, actual, "ok" if expected == actual else "MISMATCH"])
+
+    totals, suggesters, stats, elapsed = export_students(session, auth, edition, pagesize, prefetch)
+    throughput = [[f'prefetch {prefetch}', totals["students"], stats["pages"], f'{elapsed:.2f}',
+                   f'{totals["students"] / elapsed:.0f}', f'{stats["bytes"] / 1024 / 1024 / elapsed:.2f}']]
+    if flag("--compare"):
+        _, _, sequential, sequentialelapsed = export_students(session, auth, edition, pagesize, 0)
+        throughput.append(["one page at a time", totals["students"], sequential["pages"],
+                           f'{sequentialelapsed:.2f}', f'{totals["students"] / sequentialelapsed:.0f}',
+                           f'{sequential["bytes"] / 1024 / 1024 / sequentialelapsed:.2f}'])
+    check("failed suggestion lookups", 0, totals["failed suggestion lookups"])
+
+    # every project only keeps the ids of its own students, the conflicts are derived from those
+    projects = Counter()
+    placements = Counter()
+    conflictstudent = (manifest or {}).get("conflictStudent")
+    for project in stream(session, auth, f'{baseurl}/{edition}/projects', None, pagesize, prefetch):
+        projects["projects"] += 1
+        projects["positions"] += len(project["positions"])
+        projects["assignments"] += len(project["assignments"])
+        students = session.get(f'{baseurl}/{edition}/projects/{project["id"]}/students',
+                               headers=auth.headers()).json()
+        placements.update(student["id"] for student in students)
+        # the seeder only assigns accepted students, apart from the student it forces into a conflict
+        projects["students not accepted"] += sum(1 for student in students
+                                                 if student["status"] != "Yes" and student["id"] != conflictstudent)
+    conflicts = {id_from_url(conflict["student"]) for conflict in
+                 session.get(f'{baseurl}/{edition}/projects/conflicts', headers=auth.headers()).json()}
+    check("conflicts match students in several projects",
+          sorted(student for student, count in placements.items() if count > 1), sorted(conflicts))
+
+    users = {user["id"]: user["email"] for user in session.get(f'{baseurl}/users', headers=auth.headers()).json()}
+    check("suggestions by users that don't exist", 0,
+          sum(count for userid, count in suggesters.items() if userid not in users))
+
+    if manifest:
+        check("students", manifest["students"], totals["students"])
+        for status, count in manifest["statuses"].items():
+            check(f'students with status {status}', count, totals[status])
+        check("projects", manifest["projects"], projects["projects"])
+        check("positions", manifest["projects"] * manifest["positionsPerProject"], projects["positions"])
+        check("assignments", manifest["assignments"], projects["assignments"])
+        check("communications", manifest["communications"], totals["communications"])
+        check("conflict student is a conflict", True, conflictstudent in conflicts)
+        check("assigned students that aren't accepted", 0, projects["students not accepted"])
+        check("suggestions", sum(manifest["suggestionsPerCoach"].values()), totals["suggestions"])
+        emails = {email: userid for userid, email in users.items()}
+        for email, count in manifest["suggestionsPerCoach"].items():
+            check(f'suggestions by {email}', count, suggesters[emails.get(email)])
+
+    print_table(["check", "expected", "actual", ""], checks)
+    print_table(["export", "students", "pages", "seconds", "students/s", "MB/s"], throughput)
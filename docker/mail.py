@@ -0,0 +1,201 @@
+"""
+Mail mode: measures what outbound email costs the backend. It starts a local SMTP server that captures every message,
+optionally slowly or unreliably, and fires invites, password resets and email communications at the same time.
+
+    python3 bench.py mail [--count 200] [--workers 250] [--smtp-port 2525] [--smtp-delay 0.5] [--smtp-failures 0.05]
+                          [--start-backend]
+
+The backend has to send its mail to this server, so it should run with
+    OSOC_SMTP_HOST=localhost OSOC_SMTP_PORT=2525 OSOC_GMAIL_ADDRESS=bench@mail.test OSOC_GMAIL_APP_PASSWORD=bench
+--start-backend starts (and afterwards stops) the backend with these variables through ./mvnw, like populate does.
+Email communications only register that a mail was sent and don't go through EmailService, they serve as a baseline.
+A cheap probe request runs before and during the load, if its latency rises the mail requests are holding on to
+request threads. That only shows once the senders outnumber the 200 request threads Tomcat has by default, so
+--workers defaults to 250 and --count to enough requests to keep them busy. The accounts created for the password
+resets are removed again afterwards.
+"""
+import os
+import random
+import socketserver
+import subprocess
+import threading
+import time
+
+from benchutil import (Auth, baseurl, edition_name, fetch_all, flag, latency_header, latency_row, make_session,
+                       option, print_table, run_concurrently, summarize, timed)
+
+backend = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+
+class CapturingSmtpServer(socketserver.ThreadingTCPServer):
+    """
+    The smallest part of SMTP that JavaMailSender needs. It doesn't offer AUTH or STARTTLS, so the backend
+    sends without them. Every accepted message is timestamped per recipient.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, port, delay, failures):
+        super().__init__(('localhost', port), SmtpHandler)
+        self.delay = delay
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.received = {}
+        self.rejected = 0
+
+
+class SmtpHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        server = self.server
+        recipients = []
+        self.reply('220 localhost ESMTP osoc benchmark')
+        for raw in self.rfile:
+            command = raw.decode(errors='replace').strip()
+            verb = command[:4].upper()
+            if verb in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif verb == 'MAIL':
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command[command.index(':') + 1:].strip().strip('<>'))
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                for line in self.rfile:
+                    if line.rstrip(b'\r\n') == b'.':
+                        break
+                time.sleep(server.delay)
+                if random.random() < server.failures:
+                    with server.lock:
+                        server.rejected += 1
+                    self.reply('451 4.3.0 Simulated failure')
+                else:
+                    now = time.perf_counter()
+                    with server.lock:
+                        for recipient in recipients:
+                            server.received[recipient] = now
+                    self.reply('250 OK')
+            elif verb in ('RSET', 'NOOP'):
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+def start_backend(port):
+    environment = dict(os.environ, OSOC_SMTP_HOST='localhost', OSOC_SMTP_PORT=str(port),
+                       OSOC_GMAIL_ADDRESS='bench@mail.test', OSOC_GMAIL_APP_PASSWORD='bench')
+    subprocess.run(['./mvnw', 'spring-boot:start'], cwd=backend, env=environment, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def stop_backend():
+    subprocess.run(['./mvnw', 'spring-boot:stop'], cwd=backend, stdout=subprocess.DEVNULL)
+
+
+def remove_reset_accounts(session, auth, workers):
+    # also removes the ones an interrupted run left behind
+    users = session.get(f'{baseurl}/users', headers=auth.headers()).json()
+    run_concurrently(lambda user: session.delete(f'{baseurl}/users/{user["id"]}', headers=auth.headers()),
+                     [user for user in users if user["email"].startswith('bench-reset-')], workers)
+
+
+def probe(session, auth, stop, latencies):
+    while not stop.is_set():
+        latency, _ = timed(session.get, f'{baseurl}/editions/active', headers=auth.headers())
+        latencies.append(latency)
+        time.sleep(0.1)
+
+
+def main():
+    count = option("--count", "-n", 200, int)
+    # more than the 200 request threads of Tomcat (server.tomcat.threads.max), so slow mail can exhaust them
+    workers = option("--workers", "-c", 250, int)
+    port = option("--smtp-port", None, 2525, int)
+    delay = option("--smtp-delay", None, 0.5, float)
+    server = CapturingSmtpServer(port, delay, option("--smtp-failures", None, 0.0, float))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    if flag("--start-backend"):
+        start_backend(port)
+
+    session = make_session(workers + 1)
+    auth = Auth(session)
+    try:
+        auth.login()
+        edition = edition_name(session, auth)
+        students = [student["id"] for student in fetch_all(session, auth, f'{baseurl}/{edition}/students',
+                                                           {"view": "Basic"})]
+        # password resets are only mailed to existing accounts
+        run_concurrently(lambda i: session.post(f'{baseurl}/users', json={
+            "username": f'benchreset{i}', "email": f'bench-reset-{i}@mail.test', "password": "benchbench"}),
+            range(count), workers)
+
+        plaintext = {'Content-Type': 'text/plain'}
+        jobs = [("invite", f'bench-invite-{i}@mail.test') for i in range(count)]
+        jobs += [("password reset", f'bench-reset-{i}@mail.test') for i in range(count)]
+        jobs += [("communication", random.choice(students)) for _ in range(count)]
+        random.shuffle(jobs)
+
+        def send(item):
+            kind, target = item
+            start = time.perf_counter()
+            if kind == "invite":
+                response = session.post(f'{baseurl}/invite', data=target,
+                                        headers=dict(auth.headers(), **plaintext))
+            elif kind == "password reset":
+                response = session.post(f'{baseurl}/forgotPassword', data=target, headers=plaintext)
+            else:
+                response = session.post(f'{baseurl}/{edition}/communications/{target}', json={
+                    "message": "benchmark", "type": "Email"}, headers=auth.headers())
+            return kind, target, start, time.perf_counter() - start, response.ok
+
+        stop = threading.Event()
+        idle, loaded = [], []
+        thread = threading.Thread(target=probe, args=(session, auth, stop, idle))
+        thread.start()
+        time.sleep(3)
+        stop.set()
+        thread.join()
+
+        stop = threading.Event()
+        thread = threading.Thread(target=probe, args=(session, auth, stop, loaded))
+        thread.start()
+        start = time.perf_counter()
+        results = run_concurrently(send, jobs, workers)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        thread.join()
+        # mails can still be underway when the last request returns
+        time.sleep(delay + 1)
+    finally:
+        if auth.token is not None:
+            remove_reset_accounts(session, auth, workers)
+        if flag("--start-backend"):
+            stop_backend()
+        server.shutdown()
+
+    kinds = ["invite", "password reset", "communication"]
+    print(f'{len(jobs)} requests in {elapsed:.1f}s with {workers} workers, SMTP delay {delay * 1000:.0f} ms\n')
+    rows = [latency_row(kind, [latency for k, _, _, latency, _ in results if k == kind]) for kind in kinds]
+    print_table(latency_header, rows + [latency_row("probe idle", idle), latency_row("probe loaded", loaded)])
+
+    rows = []
+    for kind in kinds[:2]:
+        sent = [(target, start) for k, target, start, _, _ in results if k == kind]
+        lags = [server.received[target] - start for target, start in sent if target in server.received]
+        failed = sum(1 for k, _, _, _, ok in results if k == kind and not ok)
+        rows.append([kind, len(sent), len(lags), failed, f'{summarize(lags)["mean"]:.1f}',
+                     f'{summarize(lags)["p95"]:.1f}'])
+    print_table(["", "requested", "delivered", "failed requests", "mean lag ms", "p95 lag ms"], rows)
+    print(f'{server.rejected} messages rejected by the SMTP server')
+
+    mailing = [latency for kind, _, _, latency, _ in results if kind != "communication"]
+    if mailing and summarize(mailing)["p50"] >= delay * 1000:
+        print('Mail requests take at least the SMTP delay: they send synchronously on the request thread')
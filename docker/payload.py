@@ -0,0 +1,91 @@
+"""
+Payload mode: profiles the size of the responses of every endpoint, view and page size, and what it costs a client
+to decode them.
+
+    python3 bench.py payload [--page-sizes 10,50,200] [--repeat 20] [--bandwidth 2]
+
+For every response it records the uncompressed size, the size after gzip, the number of JSON objects and the median
+decode time with the stdlib json module and with orjson (or ujson), when one of those is installed. --bandwidth is
+the link speed in Mbit/s used to estimate the transfer time with and without compression.
+"""
+import gzip
+import json
+import statistics
+import time
+
+from benchutil import Auth, baseurl, edition_name, fetch_all, int_list, make_session, option, print_table
+
+try:
+    import orjson as fastjson
+except ImportError:
+    try:
+        import ujson as fastjson
+    except ImportError:
+        fastjson = None
+
+views = ["Basic", "List", "Extra", "Communication", "Full"]
+
+
+def count_objects(value):
+    if isinstance(value, dict):
+        return 1 + sum(count_objects(item) for item in value.values())
+    if isinstance(value, list):
+        return sum(count_objects(item) for item in value)
+    return 0
+
+
+def decode_time(loads, body, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loads(body)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def targets(session, auth, edition, pagesizes):
+    student = next(fetch_all(session, auth, f'{baseurl}/{edition}/students', {"view": "Basic"}, 1), None)
+    project = next(fetch_all(session, auth, f'{baseurl}/{edition}/projects', None, 1), None)
+    for view in views:
+        for pagesize in pagesizes:
+            yield f'students view={view}', pagesize, f'{baseurl}/{edition}/students', {"view": view,
+                                                                                       "pageSize": pagesize}
+        if student:
+            yield f'student view={view}', None, f'{baseurl}/{edition}/students/{student["id"]}', {"view": view}
+    for pagesize in pagesizes:
+        yield "projects", pagesize, f'{baseurl}/{edition}/projects', {"pageSize": pagesize}
+    if project:
+        yield "project", None, f'{baseurl}/{edition}/projects/{project["id"]}', {}
+        yield "project students", None, f'{baseurl}/{edition}/projects/{project["id"]}/students', {}
+    yield "conflicts", None, f'{baseurl}/{edition}/projects/conflicts', {}
+    yield "users", None, f'{baseurl}/users', {}
+
+
+def main():
+    pagesizes = option("--page-sizes", None, [10, 50, 200], int_list)
+    repeat = option("--repeat", "-r", 20, int)
+    # bytes per millisecond
+    bandwidth = option("--bandwidth", None, 2.0, float) * 1000 * 1000 / 8 / 1000
+    session = make_session(1)
+    auth = Auth(session)
+    auth.login()
+    edition = edition_name(session, auth)
+    if fastjson is None:
+        print("orjson and ujson are not installed, only the stdlib json decoder is measured")
+
+    rows = []
+    for name, pagesize, url, params in targets(session, auth, edition, pagesizes):
+        # ask for the plain body, so the sizes don't depend on whether the server compresses
+        response = session.get(url, params=params, headers=dict(auth.headers(), **{'Accept-Encoding': 'identity'}))
+        response.raise_for_status()
+        body = response.content
+        compressed = len(gzip.compress(body))
+        rows.append([
+            name, pagesize or "-", f'{len(body) / 1024:.1f}', f'{compressed / 1024:.1f}',
+            f'{len(body) / max(1, compressed):.1f}', count_objects(json.loads(body)),
+            f'{decode_time(json.loads, body, repeat):.2f}',
+            f'{decode_time(fastjson.loads, body, repeat):.2f}' if fastjson else "-",
+            f'{len(body) / bandwidth:.0f}', f'{compressed / bandwidth:.0f}',
+        ])
+    print_table(["endpoint", "page size", "raw KB", "gzip KB", "ratio", "objects", "json ms",
+                 f'{fastjson.__name__ if fastjson else "fast"} ms', "transfer ms", "gzip transfer ms"], rows)
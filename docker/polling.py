@@ -0,0 +1,163 @@
+"""
+Polling mode: coaches polling the student, project and conflict lists, with a client that caches responses like a
+browser does, while a writer occasionally changes the data they are looking at.
+
+    python3 bench.py polling [--coaches 20] [--interval 5] [--write-interval 20] [--duration 120]
+
+Every coach keeps its own cache. Responses are reused without a request while Cache-Control max-age allows it and
+revalidated with If-None-Match and If-Modified-Since when the backend sent an ETag or Last-Modified header. As long as
+the backend sends no validators at all, every 200 whose body equals the cached one is counted as redundant: that is
+the load a 304 could have saved.
+"""
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+
+from benchutil import Auth, baseurl, edition_name, flag, make_session, option, print_table, summarize
+
+
+class CachingClient:
+    def __init__(self, session, auth):
+        self.session = session
+        self.auth = auth
+        self.cache = {}
+
+    def get(self, url, params, tally):
+        key = (url, tuple(sorted(params.items())))
+        cached = self.cache.get(key)
+        if cached and time.monotonic() < cached["expires"]:
+            tally.record("fresh", 0.0, 0, len(cached["body"]))
+            return cached["body"]
+
+        headers = self.auth.headers()
+        if cached and cached["etag"]:
+            headers['If-None-Match'] = cached["etag"]
+        if cached and cached["modified"]:
+            headers['If-Modified-Since'] = cached["modified"]
+        start = time.perf_counter()
+        response = self.session.get(url, params=params, headers=headers)
+        latency = time.perf_counter() - start
+
+        if response.status_code == 304 and cached:
+            cached["expires"] = expiry(response)
+            tally.record("revalidated", latency, len(response.content), len(cached["body"]))
+            return cached["body"]
+        # an error response is recorded as an error by the coach and never ends up in the cache
+        response.raise_for_status()
+        body = response.content
+        digest = hashlib.sha1(body).digest()
+        tally.record("redundant" if cached and cached["digest"] == digest else "changed", latency, len(body), 0)
+        self.cache[key] = {"body": body, "digest": digest, "expires": expiry(response),
+                           "etag": response.headers.get('ETag'), "modified": response.headers.get('Last-Modified')}
+        return body
+
+
+def expiry(response):
+    control = response.headers.get('Cache-Control', '')
+    match = re.search(r'max-age=(\d+)', control)
+    if match is None or 'no-cache' in control or 'no-store' in control:
+        return 0.0
+    return time.monotonic() + int(match.group(1))
+
+
+class Tally:
+    # outcomes: fresh (served from the cache), revalidated (304), redundant (200 with an unchanged body), changed,
+    # error (the request failed)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.received = defaultdict(int)
+        self.saved = defaultdict(int)
+
+    def record(self, outcome, latency, received, saved):
+        with self.lock:
+            self.latencies[outcome].append(latency)
+            self.received[outcome] += received
+            self.saved[outcome] += saved
+
+
+def coach(session, auth, edition, interval, deadline, tallies):
+    client = CachingClient(session, auth)
+    polls = {
+        "students": (f'{baseurl}/{edition}/students', {"pageNumber": 0, "pageSize": 50, "view": "List"}),
+        "projects": (f'{baseurl}/{edition}/projects', {}),
+        "conflicts": (f'{baseurl}/{edition}/projects/conflicts', {}),
+    }
+    # coaches don't all open the page at the same moment
+    time.sleep(random.uniform(0, interval))
+    while time.monotonic() < deadline:
+        for name, (url, params) in polls.items():
+            start = time.perf_counter()
+            try:
+                client.get(url, params, tallies[name])
+            except Exception:
+                # a failed poll is counted, the coach keeps polling
+                tallies[name].record("error", time.perf_counter() - start, 0, 0)
+        time.sleep(interval)
+
+
+def writer(session, auth, edition, students, interval, deadline, writes):
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        try:
+            response = session.post(f'{baseurl}/{edition}/students/{random.choice(students)}/status',
+                                    json=random.choice(["Yes", "No", "Maybe", "Undecided"]), headers=auth.headers())
+        except Exception:
+            continue
+        if response.ok:
+            writes.append(time.monotonic())
+
+
+def main():
+    coaches = option("--coaches", "-n", 20, int)
+    interval = option("--interval", "-i", 5.0, float)
+    duration = option("--duration", "-t", 120, int)
+    if flag("--seed", "-s"):
+        random.seed(1)
+    session = make_session(coaches + 1)
+    auth = Auth(session)
+    auth.login()
+    edition = edition_name(session, auth)
+    # writes go to the students on the first page, which is the one every coach polls
+    students = [student["id"] for student in session.get(
+        f'{baseurl}/{edition}/students', params={"pageNumber": 0, "pageSize": 50, "view": "Basic"},
+        headers=auth.headers()).json()["collection"]]
+
+    tallies = {name: Tally() for name in ("students", "projects", "conflicts")}
+    writes = []
+    deadline = time.monotonic() + duration
+    threads = [threading.Thread(target=coach, args=(session, auth, edition, interval, deadline, tallies))
+               for _ in range(coaches)]
+    threads.append(threading.Thread(target=writer, args=(
+        session, auth, edition, students, option("--write-interval", "-w", 20.0, float), deadline, writes)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f'{coaches} coaches polling every {interval:.0f}s for {duration}s, {len(writes)} writes\n')
+    rows = []
+    for name, tally in tallies.items():
+        polls = sum(len(latencies) for latencies in tally.latencies.values())
+        hits = len(tally.latencies["fresh"]) + len(tally.latencies["revalidated"])
+        full = tally.latencies["changed"] + tally.latencies["redundant"]
+        fullmean = summarize(full)["mean"]
+        revalidatedmean = summarize(tally.latencies["revalidated"])["mean"]
+        # without a full response to compare with, nothing can be said about the latency that was saved
+        latencysaved = (len(tally.latencies["fresh"]) * fullmean
+                        + len(tally.latencies["revalidated"]) * (fullmean - revalidatedmean)) if full else 0.0
+        received = sum(tally.received.values())
+        rows.append([
+            name, polls, len(tally.latencies["fresh"]), len(tally.latencies["revalidated"]),
+            len(tally.latencies["redundant"]), len(tally.latencies["changed"]), len(tally.latencies["error"]),
+            f'{hits / max(1, polls) * 100:.1f}', f'{received / 1024:.0f}',
+            f'{(tally.saved["fresh"] + tally.saved["revalidated"]) / 1024:.0f}',
+            f'{tally.received["redundant"] / 1024:.0f}', f'{latencysaved / 1000:.1f}',
+            f'{len(tally.latencies["redundant"]) * fullmean / 1000:.1f}',
+        ])
+    print_table(["endpoint", "polls", "fresh", "304", "redundant 200", "changed 200", "errors", "hit %", "received KB",
+                 "saved KB", "redundant KB", "saved s", "redundant s"], rows)
+    print("fresh and 304 are what the cache saves today, redundant is what validators on the backend could still save")
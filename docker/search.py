@@ -0,0 +1,182 @@
+"""
+Search mode: seeds students whose names and skills follow tunable distributions, derives a corpus of student filter
+queries with known match counts and measures filter latency against the selectivity of every query.
+
+    python3 bench.py search --generate [--size 2000] [--zipf 1.1] [--surnames 50] [--prefixes 5]
+                            [--prefix-share 0.3] [--tail 20] [--alumni 0.1] [--student-coaches 0.2]
+    python3 bench.py search [--repeat 5] [--page-size 50] [--view List] [--csv search.csv]
+
+The corpus is written to and read from --corpus (search_corpus.json by default). Students are generated in --edition,
+or the active edition, and the expected counts also take the students that were already in it into account.
+"""
+import csv
+import json
+import random
+import string
+
+from faker import Faker
+
+from benchutil import (Auth, baseurl, edition_name, fetch_all, flag, make_session, option, print_table,
+                       run_concurrently, summarize, timed)
+from studentform import make_student, roles
+
+
+def zipf_weights(count, exponent):
+    return [1 / rank ** exponent for rank in range(1, count + 1)]
+
+
+def preprocess(text):
+    # same normalisation as nameMatchesSearchQuery in ServicesUtil.kt
+    return text.lower().replace(" ", "")
+
+
+def generate(session, auth, edition, workers, fake):
+    size = option("--size", None, 2000, int)
+    exponent = option("--zipf", None, 1.1, float)
+    alumni = option("--alumni", None, 0.1, float)
+    studentcoaches = option("--student-coaches", None, 0.2, float)
+    prefixshare = option("--prefix-share", None, 0.3, float)
+
+    # popularity rank is random, so the most popular skill isn't always the first role of the form
+    skills = [role for role in roles if role != "Other"]
+    skills += list({fake.unique.job().replace(",", "") for _ in range(option("--tail", None, 20, int))})
+    random.shuffle(skills)
+    skillweights = zipf_weights(len(skills), exponent)
+    surnames = list({fake.unique.last_name() for _ in range(option("--surnames", None, 50, int))})
+    surnameweights = zipf_weights(len(surnames), exponent)
+    prefixes = list({fake.first_name()[:3] for _ in range(option("--prefixes", None, 5, int))})
+
+    def make():
+        # half of the students have one skill, a quarter two and a quarter three
+        target = random.choice([1, 1, 2, 3])
+        chosen = []
+        while len(chosen) < target:
+            skill = random.choices(skills, skillweights)[0]
+            # the form only has room for a single skill that isn't one of the roles
+            if skill not in chosen and (skill in roles or all(other in roles for other in chosen)):
+                chosen.append(skill)
+        if random.random() < prefixshare:
+            firstname = random.choice(prefixes) + "".join(random.choices(string.ascii_lowercase, k=3))
+        else:
+            firstname = fake.first_name()
+        return make_student(fake, firstname, random.choices(surnames, surnameweights)[0], chosen,
+                            random.random() < alumni, random.random() < studentcoaches)
+
+    def post(body):
+        session.post(f'{baseurl}/{edition}/students', json=body, headers=auth.headers()).raise_for_status()
+
+    # generated before posting concurrently, so --seed gives the same students on every run
+    run_concurrently(post, [make() for _ in range(size)], workers)
+    return {"skills": skills, "surnames": surnames, "prefixes": prefixes}
+
+
+def matches(student, params):
+    if params.get("alumnOnly") and not student["alumn"]:
+        return False
+    if params.get("studentCoachOnly") and not student["possibleStudentCoach"]:
+        return False
+    name = f'{student["firstName"]} {student["lastName"]}'
+    if "name" in params and preprocess(params["name"]) not in preprocess(name):
+        return False
+    if "skills" in params and not params["skills"] & student["skills"]:
+        return False
+    return True
+
+
+def build_corpus(students, pools):
+    skills, surnames, prefixes = pools["skills"], pools["surnames"], pools["prefixes"]
+    queries = []
+    ranks = sorted({0, 1, 2, 4, 9, 24, len(surnames) - 1})
+    queries += [{"name": surnames[rank]} for rank in ranks if rank < len(surnames)]
+    queries += [{"name": prefix} for prefix in prefixes]
+    sample = min(3, len(students))
+    queries += [{"name": student["firstName"][:2]} for student in random.sample(students, sample)]
+    queries += [{"name": f'{student["firstName"]} {student["lastName"]}'}
+                for student in random.sample(students, sample)]
+    queries += [{"name": "zqxj"}]
+    ranks = sorted({0, 1, 2, 4, 9, len(skills) - 1})
+    queries += [{"skills": {skills[rank]}} for rank in ranks if rank < len(skills)]
+    queries += [{"skills": {skills[0], skills[-1]}}, {"skills": set(skills[1:4])}, {"skills": {"no such skill"}}]
+    queries += [{"name": surnames[0], "alumnOnly": True}, {"skills": {skills[0]}, "studentCoachOnly": True},
+                {"name": prefixes[0], "skills": {skills[1]}}, {"alumnOnly": True}, {"studentCoachOnly": True}]
+
+    corpus = []
+    for params in queries:
+        expected = sum(1 for student in students if matches(student, params))
+        if "skills" in params:
+            params = dict(params, skills=sorted(params["skills"]))
+        corpus.append({"params": params, "expected": expected, "selectivity": expected / max(1, len(students))})
+    return corpus
+
+
+def request_params(params):
+    converted = {key: str(value).lower() if isinstance(value, bool) else value for key, value in params.items()}
+    if "skills" in converted:
+        # the controller expects every skill name between quotes, separated by commas
+        converted["skills"] = ",".join(f'"{skill}"' for skill in converted["skills"])
+    return converted
+
+
+def describe(params):
+    return " ".join(f'{key}={",".join(value) if isinstance(value, list) else value}' for key, value in params.items())
+
+
+def run(session, auth, edition, corpus, workers):
+    repeat = option("--repeat", "-r", 5, int)
+    pagesize = option("--page-size", None, 50, int)
+    view = option("--view", None, "List")
+
+    def measure(entry):
+        latencies = []
+        mismatches = 0
+        for _ in range(repeat):
+            params = dict(request_params(entry["params"]), pageSize=pagesize, view=view)
+            latency, response = timed(session.get, f'{baseurl}/{edition}/students', params=params,
+                                      headers=auth.headers())
+            latencies.append(latency)
+            mismatches += response.json()["totalLength"] != entry["expected"]
+        return entry, latencies, mismatches
+
+    results = sorted(run_concurrently(measure, corpus, workers), key=lambda result: result[0]["selectivity"])
+    rows = []
+    for entry, latencies, mismatches in results:
+        summary = summarize(latencies)
+        rows.append([describe(entry["params"]), entry["expected"], f'{entry["selectivity"] * 100:.2f}',
+                     f'{summary["mean"]:.1f}', f'{summary["p95"]:.1f}', mismatches])
+    header = ["query", "expected", "selectivity %", "mean ms", "p95 ms", "count mismatches"]
+    print_table(header, rows)
+
+    path = option("--csv")
+    if path:
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+
+def main():
+    workers = option("--workers", "-c", 8, int)
+    path = option("--corpus", None, "search_corpus.json")
+    if flag("--seed", "-s"):
+        Faker.seed(1)
+        random.seed(1)
+    session = make_session(workers)
+    auth = Auth(session)
+    auth.login()
+
+    if flag("--generate", "-g"):
+        edition = edition_name(session, auth)
+        pools = generate(session, auth, edition, workers, Faker())
+        students = [{
+            "firstName": student["firstName"], "lastName": student["lastName"], "alumn": student["alumn"],
+            "possibleStudentCoach": student["possibleStudentCoach"],
+            "skills": {skill["skillName"] for skill in student["skills"]},
+        } for student in fetch_all(session, auth, f'{baseurl}/{edition}/students', {"view": "Full"})]
+        corpus = build_corpus(students, pools)
+        with open(path, "w") as file:
+            json.dump({"edition": edition, "students": len(students), "queries": corpus}, file, indent=2)
+        print(f'Wrote {len(corpus)} queries over {len(students)} students to {path}')
+    else:
+        with open(path) as file:
+            corpus = json.load(file)
+        run(session, auth, option("--edition", "-e", corpus["edition"]), corpus["queries"], workers)
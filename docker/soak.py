@@ -0,0 +1,251 @@
+"""
+Soak mode: runs a steady mixed workload for a long time and keeps track of everything that could slowly leak.
+
+    python3 bench.py soak [--duration 14400] [--rate 5] [--window 60] [--backend-pid PID] [--no-gc]
+                          [--csv soak.csv]
+
+The workload reads student, project and conflict pages, adds and removes a suggestion, and logs in, refreshes and
+logs out a dedicated soak@mail.com account, at --rate operations per second in total. Every --window seconds it
+samples latency, errors, the RSS and (with jstat on the PATH) the old generation of the backend, after a full GC
+through jcmd unless --no-gc is given, the number of Postgres connections (through docker exec, like populate does)
+and the sockets this process has open. At the end every series that kept growing for the whole run is flagged.
+"""
+import csv
+import os
+import random
+import subprocess
+import threading
+import time
+
+from benchutil import (Auth, baseurl, edition_name, fetch_all, flag, make_session, option, percentile,
+                       print_table)
+
+soakemail = 'soak@mail.com'
+soakpassword = 'soaksoaksoak'
+container = 'osoc_postgres_container_local_dev'
+# relative weight of every operation, suggestion and auth operations are whole add/delete and login/logout cycles
+mix = {"students": 4, "projects": 2, "conflicts": 1, "suggestion": 2, "auth": 1}
+
+
+def backend_pid():
+    for pid in filter(str.isdigit, os.listdir('/proc')):
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as file:
+                cmdline = file.read()
+        except OSError:
+            continue
+        # the Maven JVM of ./mvnw also mentions the backend directory, only the application has these
+        if b'be.osoc.team1.backend.BackendApplicationKt' in cmdline or b'backend/target/classes' in cmdline:
+            return int(pid)
+    return None
+
+
+def rss_mb(pid):
+    try:
+        with open(f'/proc/{pid}/status') as file:
+            for line in file:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, TypeError):
+        return None
+    return None
+
+
+def old_generation_mb(pid, collect):
+    # used old generation space as reported by jstat, in KB. Eden rises and drops with every young collection, so
+    # only what survives into the old generation says anything about a leak, and after a full collection (collect)
+    # only what is still reachable is left there
+    try:
+        if collect:
+            subprocess.run(['jcmd', str(pid), 'GC.run'], capture_output=True, timeout=60)
+        output = subprocess.run(['jstat', '-gc', str(pid)], capture_output=True, text=True, timeout=10).stdout
+        header, values = output.split('\n')[:2]
+        columns = dict(zip(header.split(), values.split()))
+        return float(columns['OU']) / 1024
+    except (OSError, ValueError, KeyError, subprocess.SubprocessError):
+        return None
+
+
+def postgres_connections():
+    try:
+        output = subprocess.run(['docker', 'exec', container, 'psql', '-U', 'postgres', 'osoc', '-tAc',
+                                 "SELECT count(*) FROM pg_stat_activity WHERE datname = 'osoc';"],
+                                capture_output=True, text=True, timeout=10).stdout
+        return int(output.strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def open_sockets():
+    try:
+        fds = os.listdir('/proc/self/fd')
+    except OSError:
+        return None
+    sockets = 0
+    for fd in fds:
+        try:
+            sockets += os.readlink(f'/proc/self/fd/{fd}').startswith('socket:')
+        except OSError:
+            # the descriptor listdir itself used is already closed
+            continue
+    return sockets
+
+
+def kendall_tau(values):
+    concordant = discordant = 0
+    for i in range(len(values)):
+        for j in range(i + 1, len(values)):
+            concordant += values[j] > values[i]
+            discordant += values[j] < values[i]
+    pairs = len(values) * (len(values) - 1) / 2
+    return (concordant - discordant) / pairs if pairs else 0.0
+
+
+def trend(values, threshold):
+    # a series is flagged when it rises nearly monotonically (Kendall tau against time) and by a meaningful amount
+    values = [value for value in values if value is not None]
+    if len(values) < 4:
+        return None, None, False
+    tau = kendall_tau(values)
+    growth = (values[-1] - values[0]) / values[0] if values[0] else 0.0
+    return tau, growth, tau > threshold and growth > 0.1
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+
+    def record(self, latency, ok):
+        with self.lock:
+            self.latencies.append(latency)
+            self.errors += not ok
+
+    def drain(self):
+        with self.lock:
+            latencies, errors = self.latencies, self.errors
+            self.latencies, self.errors = [], 0
+        return latencies, errors
+
+
+class Pacer:
+    # hands out evenly spaced start times to all workers so the total rate stays fixed
+    def __init__(self, rate):
+        self.lock = threading.Lock()
+        self.interval = 1 / rate
+        self.next = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            slot = self.next = max(self.next + self.interval, time.monotonic())
+        time.sleep(max(0.0, slot - time.monotonic()))
+
+
+def soak_account(session):
+    # the account is only used to log in and out, so it can stay disabled
+    session.post(f'{baseurl}/users', json={"username": "soak", "email": soakemail, "password": soakpassword})
+
+
+def operation(session, auth, edition, students, authlock, name):
+    if name == "students":
+        response = session.get(f'{baseurl}/{edition}/students', headers=auth.headers(),
+                               params={"pageNumber": random.randint(0, 4), "pageSize": 50, "view": "List"})
+    elif name == "projects":
+        response = session.get(f'{baseurl}/{edition}/projects', headers=auth.headers())
+    elif name == "conflicts":
+        response = session.get(f'{baseurl}/{edition}/projects/conflicts', headers=auth.headers())
+    elif name == "suggestion":
+        studentid = random.choice(students)
+        adminid = auth.user["id"]
+        session.delete(f'{baseurl}/{edition}/students/{studentid}/suggestions/{adminid}', headers=auth.headers())
+        response = session.post(f'{baseurl}/{edition}/students/{studentid}/suggestions', json={
+            "suggester": f'{baseurl}/users/{adminid}', "status": random.choice(["Yes", "No", "Maybe"]),
+            "motivation": "soak"}, headers=auth.headers())
+        if response.ok:
+            response = session.delete(f'{baseurl}/{edition}/students/{studentid}/suggestions/{adminid}',
+                                      headers=auth.headers())
+    else:
+        # the backend keeps one valid refresh token per account, so cycles of the soak account can't overlap
+        with authlock:
+            login = session.post(f'{baseurl}/login', data={"email": soakemail, "password": soakpassword}).json()
+            refreshed = session.post(f'{baseurl}/token/refresh', data={"refreshToken": login["refreshToken"]}).json()
+            response = session.post(f'{baseurl}/logout',
+                                    headers={'Authorization': f'Basic {refreshed["accessToken"]}'})
+    return response.ok
+
+
+def worker(session, auth, edition, students, authlock, pacer, recorder, deadline):
+    names = list(mix)
+    weights = list(mix.values())
+    while True:
+        pacer.wait()
+        if time.monotonic() >= deadline:
+            return
+        start = time.perf_counter()
+        try:
+            ok = operation(session, auth, edition, students, authlock, random.choices(names, weights)[0])
+        except Exception:
+            ok = False
+        recorder.record(time.perf_counter() - start, ok)
+
+
+def main():
+    duration = option("--duration", "-t", 4 * 3600, int)
+    rate = option("--rate", "-r", 5.0, float)
+    window = option("--window", None, 60, int)
+    workers = option("--workers", "-c", 8, int)
+    pid = option("--backend-pid", None, None, int) or backend_pid()
+    collect = not flag("--no-gc")
+    if flag("--seed", "-s"):
+        random.seed(1)
+    session = make_session(workers)
+    auth = Auth(session)
+    auth.login()
+    edition = edition_name(session, auth)
+    students = [student["id"] for student in fetch_all(session, auth, f'{baseurl}/{edition}/students',
+                                                       {"view": "Basic"})]
+    soak_account(session)
+    if pid is None:
+        print("Backend process not found, use --backend-pid to track its memory")
+
+    recorder = Recorder()
+    pacer = Pacer(rate)
+    authlock = threading.Lock()
+    start = time.monotonic()
+    deadline = start + duration
+    threads = [threading.Thread(target=worker, daemon=True, args=(
+        session, auth, edition, students, authlock, pacer, recorder, deadline)) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    header = ["minute", "ops", "errors", "p50 ms", "p95 ms", "rss MB", "old gen MB", "pg conns", "sockets"]
+    samples = []
+    print("  ".join(header))
+    while time.monotonic() < deadline:
+        time.sleep(min(window, max(0.0, deadline - time.monotonic())))
+        latencies, errors = recorder.drain()
+        sample = [round((time.monotonic() - start) / 60, 1), len(latencies), errors,
+                  percentile(latencies, 0.5) * 1000, percentile(latencies, 0.95) * 1000,
+                  rss_mb(pid), old_generation_mb(pid, collect), postgres_connections(), open_sockets()]
+        samples.append(sample)
+        print("  ".join("-" if value is None else f'{value:.1f}' if isinstance(value, float) else str(value)
+                        for value in sample), flush=True)
+    for thread in threads:
+        thread.join()
+
+    rows = []
+    threshold = option("--tau", None, 0.6, float)
+    for index, name in enumerate(header[3:], 3):
+        tau, growth, growing = trend([sample[index] for sample in samples], threshold)
+        rows.append([name, "-" if tau is None else f'{tau:.2f}', "-" if growth is None else f'{growth * 100:.1f}',
+                     "GROWING" if growing else ""])
+    print()
+    print_table(["series", "kendall tau", "growth %", ""], rows)
+
+    path = option("--csv")
+    if path:
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(samples)
@@ -0,0 +1,222 @@
+"""
+Teardown mode: removes the data of an edition through the delete endpoints with bounded concurrency, or benchmarks
+what every kind of delete costs as the dataset grows.
+
+    python3 bench.py teardown [--edition osoc2022] [--workers 8] [--drop-edition]
+    python3 bench.py teardown --benchmark [--sizes 50,100,200,400] [--workers 8] [--force]
+
+The benchmark seeds scratch editions called benchteardown<size>. Only one edition can be active at a time and
+inactivating an edition disables every coach, so it refuses to run while another edition is active unless --force
+is given. Run it against a throwaway database.
+"""
+import random
+import sys
+import time
+
+from faker import Faker
+
+from benchutil import (Auth, active_edition, baseurl, coachpassword, fetch_all, flag, id_from_url, int_list,
+                       make_session, option, print_table, run_concurrently, summarize)
+from studentform import make_student
+
+# leaf-first removes every child through its own endpoint before the parent goes,
+# cascade leaves all of that to the student and project deletes
+orders = {
+    "leaf-first": ["assignments", "communications", "suggestions", "students", "projects"],
+    "cascade": ["students", "projects"],
+}
+
+
+def empty_dataset():
+    return {"students": [], "projects": [], "assignments": [], "communications": [], "suggestions": []}
+
+
+def discover(session, auth, edition, workers):
+    dataset = empty_dataset()
+    suggestionurls = []
+    for student in fetch_all(session, auth, f'{baseurl}/{edition}/students', {"view": "Full"}):
+        dataset["students"].append(student["id"])
+        dataset["communications"] += [id_from_url(url) for url in student["communications"]]
+        suggestionurls += [(student["id"], url) for url in student["statusSuggestions"]]
+    for project in fetch_all(session, auth, f'{baseurl}/{edition}/projects'):
+        dataset["projects"].append(project["id"])
+        dataset["assignments"] += [(project["id"], id_from_url(url)) for url in project["assignments"]]
+
+    def suggester(item):
+        studentid, url = item
+        suggestion = session.get(f'{baseurl}/statusSuggestions/{id_from_url(url)}', headers=auth.headers()).json()
+        return studentid, id_from_url(suggestion["suggester"])
+
+    dataset["suggestions"] = run_concurrently(suggester, suggestionurls, workers)
+    return dataset
+
+
+def seed(session, auth, edition, size, workers, fake):
+    # every request body is generated before it is posted concurrently, so --seed gives the same data on every run
+    dataset = empty_dataset()
+    adminid = auth.user["id"]
+
+    def post_student(body):
+        return session.post(f'{baseurl}/{edition}/students', json=body, headers=auth.headers()).json()["id"]
+
+    dataset["students"] = run_concurrently(post_student, [make_student(fake) for _ in range(size)], workers)
+
+    def post_project(body):
+        return session.post(f'{baseurl}/{edition}/projects', json=body, headers=auth.headers()).json()
+
+    projects = run_concurrently(post_project, [{
+        "clientName": fake.company(), "name": fake.catch_phrase(), "description": fake.bs(),
+        "positions": [{"skill": {"skillName": fake.job()}, "amount": random.randint(1, 7)} for _ in range(5)]}
+        for _ in range(max(1, size // 10))], workers)
+    dataset["projects"] = [project["id"] for project in projects]
+
+    # projects are saved as a whole aggregate, so assignments to the same project are posted sequentially
+    def assign(item):
+        project, bodies = item
+        for body in bodies:
+            session.post(f'{baseurl}/{edition}/projects/{project["id"]}/assignments', json=body,
+                         headers=auth.headers())
+        assignments = session.get(f'{baseurl}/{edition}/projects/{project["id"]}',
+                                  headers=auth.headers()).json()["assignments"]
+        return [(project["id"], id_from_url(url)) for url in assignments]
+
+    plans = [(project, [{"student": studentid, "position": id_from_url(random.choice(project["positions"])),
+                         "suggester": adminid, "reason": fake.sentence()}
+                        for studentid in random.sample(dataset["students"], min(4, size))]) for project in projects]
+    dataset["assignments"] = [item for items in run_concurrently(assign, plans, workers) for item in items]
+
+    def communicate(item):
+        studentid, body = item
+        return session.post(f'{baseurl}/{edition}/communications/{studentid}', json=body,
+                            headers=auth.headers()).json()["id"]
+
+    dataset["communications"] = run_concurrently(communicate, [
+        (studentid, {"message": fake.sentence(), "type": "Email"})
+        for studentid in random.sample(dataset["students"], size // 4)], workers)
+
+    def suggest(item):
+        studentid, body = item
+        session.post(f'{baseurl}/{edition}/students/{studentid}/suggestions', json=body, headers=auth.headers())
+        return studentid, adminid
+
+    dataset["suggestions"] = run_concurrently(suggest, [
+        (studentid, {"suggester": f'{baseurl}/users/{adminid}', "status": random.choice(["Yes", "No", "Maybe"]),
+                     "motivation": fake.sentence()})
+        for studentid in random.sample(dataset["students"], size // 4)], workers)
+    return dataset
+
+
+def coach_auths(session, auth, coachids):
+    # suggestions can only be removed by the coach who made them, the seeded coaches all share one password
+    auths = {auth.user["id"]: auth}
+    for coachid in set(coachids) - auths.keys():
+        user = session.get(f'{baseurl}/users/{coachid}', headers=auth.headers()).json()
+        auths[coachid] = Auth(session, user["email"], coachpassword)
+    return auths
+
+
+def delete_kind(session, auth, edition, dataset, kind, workers):
+    auths = {}
+    if kind == "suggestions":
+        auths = coach_auths(session, auth, [coachid for _, coachid in dataset["suggestions"]])
+    urls = {
+        "assignments": lambda item: f'{baseurl}/{edition}/projects/{item[0]}/assignments/{item[1]}',
+        "communications": lambda item: f'{baseurl}/{edition}/communications/{item}',
+        "suggestions": lambda item: f'{baseurl}/{edition}/students/{item[0]}/suggestions/{item[1]}',
+        "students": lambda item: f'{baseurl}/{edition}/students/{item}',
+        "projects": lambda item: f'{baseurl}/{edition}/projects/{item}',
+    }
+
+    def delete(item):
+        start = time.perf_counter()
+        try:
+            # a coach that can't log in with the shared password counts as a failed delete, not a stopped teardown
+            headers = auths[item[1]].headers() if kind == "suggestions" else auth.headers()
+            ok = session.delete(urls[kind](item), headers=headers).status_code < 400
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    results = run_concurrently(delete, dataset[kind], workers)
+    wall = time.perf_counter() - start
+    latencies = [latency for latency, _ in results]
+    return latencies, wall, sum(1 for _, ok in results if not ok)
+
+
+def result_row(size, order, kind, latencies, wall, failed):
+    summary = summarize(latencies)
+    rate = len(latencies) / wall if wall else 0.0
+    return [size, order, kind, summary["count"], f'{summary["mean"]:.1f}', f'{summary["p95"]:.1f}', f'{wall:.2f}',
+            f'{rate:.1f}', failed]
+
+
+result_header = ["size", "order", "kind", "count", "mean ms", "p95 ms", "wall s", "ops/s", "failed"]
+
+
+def teardown(session, auth, edition, workers, dropedition):
+    dataset = discover(session, auth, edition, workers)
+    rows = []
+    for kind in orders["leaf-first"]:
+        latencies, wall, failed = delete_kind(session, auth, edition, dataset, kind, workers)
+        rows.append(result_row(len(dataset["students"]), "leaf-first", kind, latencies, wall, failed))
+    if dropedition:
+        start = time.perf_counter()
+        status = session.delete(f'{baseurl}/editions/{edition}', headers=auth.headers()).status_code
+        wall = time.perf_counter() - start
+        rows.append(result_row(len(dataset["students"]), "edition", "edition", [wall], wall, int(status >= 400)))
+    print_table(result_header, rows)
+
+
+def benchmark(session, auth, sizes, workers, force, fake):
+    active = active_edition(session, auth)
+    if active and not force:
+        print(f'Edition {active["name"]} is active, the benchmark needs to activate its own editions. '
+              'Use --force to inactivate it for the duration of the run (this disables every coach).')
+        sys.exit(1)
+    if active:
+        session.post(f'{baseurl}/editions/{active["name"]}/inactivate', headers=auth.headers())
+
+    rows = []
+    try:
+        for size in sizes:
+            edition = f'benchteardown{size}'
+            # leftovers of an interrupted run
+            session.delete(f'{baseurl}/editions/{edition}', headers=auth.headers())
+            session.post(f'{baseurl}/editions', json=edition, headers=auth.headers())
+            session.post(f'{baseurl}/editions/{edition}/activate', headers=auth.headers())
+            for order, kinds in orders.items():
+                dataset = seed(session, auth, edition, size, workers, fake)
+                for kind in kinds:
+                    latencies, wall, failed = delete_kind(session, auth, edition, dataset, kind, workers)
+                    rows.append(result_row(size, order, kind, latencies, wall, failed))
+            # the whole edition in one request, which is what timed out in production
+            seed(session, auth, edition, size, workers, fake)
+            start = time.perf_counter()
+            status = session.delete(f'{baseurl}/editions/{edition}', headers=auth.headers()).status_code
+            wall = time.perf_counter() - start
+            rows.append(result_row(size, "edition", "edition", [wall], wall, int(status >= 400)))
+    finally:
+        # also after a failure or Ctrl-C, so the real edition never stays inactive. A scratch edition that is still
+        # active has to go first, the backend refuses a second active edition
+        if active:
+            current = active_edition(session, auth)
+            if current and current["name"] != active["name"]:
+                session.post(f'{baseurl}/editions/{current["name"]}/inactivate', headers=auth.headers())
+            session.post(f'{baseurl}/editions/{active["name"]}/activate', headers=auth.headers())
+    print_table(result_header, rows)
+
+
+def main():
+    workers = option("--workers", "-c", 8, int)
+    if flag("--seed", "-s"):
+        Faker.seed(1)
+        random.seed(1)
+    session = make_session(workers)
+    auth = Auth(session)
+    auth.login()
+    if flag("--benchmark", "-b"):
+        benchmark(session, auth, option("--sizes", None, [50, 100, 200, 400], int_list), workers,
+                  flag("--force", "-f"), Faker())
+    else:
+        teardown(session, auth, option("--edition", "-e", "osoc2022"), workers, flag("--drop-edition", "-d"))